@@ -22,6 +22,20 @@ const PYTHON_REQUIREMENTS = path.join(
 // 虚拟环境目录，放在用户目录下保证跨 npx 调用持久化
 const VENV_DIR = path.join(os.homedir(), ".pdf2docx-mcp", "venv");
 
+// 已安装依赖时所用 requirements.txt 的副本，内容变化（如升级后新增依赖）时重新安装
+const REQUIREMENTS_STAMP = path.join(VENV_DIR, ".requirements.txt");
+
+function requirementsChanged() {
+  try {
+    return (
+      fs.readFileSync(REQUIREMENTS_STAMP, "utf8") !==
+      fs.readFileSync(PYTHON_REQUIREMENTS, "utf8")
+    );
+  } catch {
+    return true;
+  }
+}
+
 // 获取虚拟环境中的 Python 可执行文件路径
 function getVenvPython() {
   if (process.platform === "win32") {
@@ -85,10 +99,13 @@ async function ensureDependencies(venvPython) {
   }
 
   try {
-    // 检查 mcp 包是否已安装
+    // 检查依赖是否有变化，以及 mcp 包是否已安装
+    if (requirementsChanged()) {
+      throw new Error("requirements.txt changed");
+    }
     await spawnAsync(venvPython, ["-c", "import mcp"]);
   } catch {
-    // 未安装，执行安装
+    // 未安装或依赖有变化，执行安装
     console.error("Installing Python dependencies...");
     try {
       await spawnAsync(
@@ -98,6 +115,7 @@ async function ensureDependencies(venvPython) {
           stdio: "inherit",
         },
       );
+      fs.copyFileSync(requirementsPath, REQUIREMENTS_STAMP);
       console.error("Python dependencies installed successfully\n");
     } catch {
       console.error("\nFailed to install Python dependencies");
@@ -5,21 +5,36 @@ pdf2docx MCP 服务器
 """
 
 import asyncio
+import contextlib
+import copy
+import functools
 import logging
+import multiprocessing
 import os
 import re
 import sys
+import tempfile
 import threading
 import time
-from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, Callable, NamedTuple, Optional, Sequence
 
 # 将当前目录加入模块搜索路径
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from mcp.server import FastMCP
 from mcp.server.fastmcp import Context
-from pdf2docx import Converter
-import fitz  # PyMuPDF
+
+# pdf2docx, PyMuPDF (fitz) and python-docx are imported inside the functions
+# that use them: they are slow to load and would otherwise delay the MCP
+# handshake, and get_info never needs pdf2docx at all.
+#
+# PyMuPDF picks its message streams when first imported and defaults them to
+# stdout, which carries JSON-RPC in stdio mode; its import-time deprecation
+# warning would otherwise race the MCP handshake. Set before any import, so the
+# warmup thread, tool calls and spawned workers all write to stderr.
+os.environ.setdefault("PYMUPDF_MESSAGE", "fd:2")
+os.environ.setdefault("PYMUPDF_LOG", "fd:2")
 
 # 创建 MCP 服务器实例
 mcp = FastMCP(
@@ -28,59 +43,501 @@ mcp = FastMCP(
 )
 
 # pdf2docx logs "(N/Total) Page X" at INFO level (root logger, not a named logger)
-# Matches patterns like "(1/10) Page 1" or "(3/5)..."
+# Matches, at the start of the message, patterns like "(1/10) Page 1" or "(3/5)..."
 _PAGE_LOG_RE = re.compile(r"\((\d+)/(\d+)\)")
 
+# Page specs such as "3", "0,1,2", "0-5" or "0,2-4,7"
+_PAGES_RE = re.compile(r"^\s*\d+\s*(-\s*\d+\s*)?(,\s*\d+\s*(-\s*\d+\s*)?)*$")
 
-class _ProgressLogHandler(logging.Handler):
-    """Intercepts pdf2docx page-level log messages to emit MCP progress notifications.
+# Spawning a worker and importing pdf2docx in it costs about as much as
+# converting 8 text pages (~1.1 s vs ~0.14 s per page), and every worker
+# re-opens the PDF. Only fan out when each worker gets at least this many pages,
+# so start-up stays a small fraction of its share; smaller jobs are converted in
+# a single Converter.
+_MIN_PAGES_PER_WORKER = 32
+
+# Worker processes are spawned, not forked: the server runs several threads
+# (asyncio.to_thread workers, MCP stdio, the startup preload), and a fork taken
+# while one of them holds an import or logging lock can deadlock the child.
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+# Seconds between progress notifications. Log records only bump a counter;
+# a per-request task reports it on this interval instead of once per page.
+_PROGRESS_INTERVAL = 0.1
+
+
+def _max_concurrency() -> int:
+    """Read PDF2DOCX_MAX_CONCURRENCY; unset or invalid values mean the CPU count."""
+    default = os.cpu_count() or 4
+    raw = os.environ.get("PDF2DOCX_MAX_CONCURRENCY")
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        value = 0
+    if value < 1:
+        logging.getLogger(__name__).warning(
+            "Ignoring invalid PDF2DOCX_MAX_CONCURRENCY=%r, using %d", raw, default
+        )
+        return default
+    return value
+
+
+class _ConversionSlots:
+    """Bounds the number of pdf2docx Converters running at once.
+
+    Every Converter takes one slot, whether it runs in a thread or in a worker
+    process, so a request fanning out into N processes holds N slots.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self._sem = asyncio.Semaphore(limit)
+        # Multi-slot acquisitions take turns, so two requests can never each
+        # hold part of what they need and wait on each other forever.
+        self._acquire_lock = asyncio.Lock()
+
+    @contextlib.asynccontextmanager
+    async def acquire(self, count: int = 1) -> AsyncIterator[None]:
+        """Hold `count` slots (at most the limit) for the duration of the block."""
+        count = min(count, self.limit)
+        acquired = 0
+        try:
+            async with self._acquire_lock:
+                while acquired < count:
+                    await self._sem.acquire()
+                    acquired += 1
+            yield
+        finally:
+            for _ in range(acquired):
+                self._sem.release()
+
+
+# Maximum number of Converters (threads or worker processes) running at once;
+# further work waits. Override with the PDF2DOCX_MAX_CONCURRENCY environment
+# variable.
+_MAX_CONCURRENCY = _max_concurrency()
+_CONVERT_SLOTS = _ConversionSlots(_MAX_CONCURRENCY)
+
+# PDF metadata fields returned by get_info
+_META_KEYS = ("title", "author", "subject", "creator", "producer")
+
+# Bytes read from each end of large PDFs when computing their content hash.
+_HASH_SAMPLE_BYTES = 1 << 20
+
+
+class _ProgressState:
+    """Progress counters for a single conversion.
 
     pdf2docx processes each page twice: once during parsing (phase 3/4) and once
     during docx creation (phase 4/4). We use a monotonic tick counter with
     total = 2 * pages_to_convert so progress flows 0% → 50% → 100%.
     """
 
-    def __init__(
-        self, ctx: Context, pages_to_convert: int, loop: asyncio.AbstractEventLoop
-    ) -> None:
-        super().__init__()
-        self.ctx = ctx
+    def __init__(self, pages_to_convert: int) -> None:
         # Two phases per page; multiply so each log tick advances the bar evenly
         self.total = pages_to_convert * 2
-        self.loop = loop
-        self._ticks = 0
-        # Set by bind_thread() from inside the worker thread so that concurrent
-        # conversions do not cross-contaminate each other's progress counts.
-        self._thread_id: Optional[int] = None
+        # Only ever incremented by the conversion thread and read by the
+        # reporter task; a plain int is enough under the GIL.
+        self.ticks = 0
+
+
+class _ConversionLogFilter(logging.Filter):
+    """Drops records that cannot be pdf2docx page ticks of an active conversion.
+
+    Runs before the handler formats anything or takes its lock, so records
+    from other libraries and idle threads cost a name check and a lookup.
+    """
+
+    def __init__(self, states: dict[int, _ProgressState]) -> None:
+        super().__init__()
+        self._states = states
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.name != "root" and not record.name.startswith("pdf2docx"):
+            return False
+        # Only records from threads running a registered conversion count, so
+        # concurrent conversions never cross-contaminate each other's progress.
+        return record.thread in self._states
 
-    def bind_thread(self) -> None:
-        """Record the current thread's ID. Call this from the conversion thread."""
-        self._thread_id = threading.current_thread().ident
+
+class _ProgressLogHandler(logging.Handler):
+    """Counts pdf2docx page-level log messages towards each conversion's progress.
+
+    Conversions register their _ProgressState under the ID of the thread that
+    runs pdf2docx, and records are dispatched by record.thread.
+    """
+
+    def __init__(self, level: int = logging.NOTSET) -> None:
+        super().__init__(level)
+        self._states: dict[int, _ProgressState] = {}
+        # Guards writes only; emit() and the filter read with a single dict
+        # lookup, which is atomic under the GIL.
+        self._states_lock = threading.Lock()
+        self.addFilter(_ConversionLogFilter(self._states))
+        # Bound once; emit() runs for every log record of every conversion.
+        self._get_state = self._states.get
+        self._match = _PAGE_LOG_RE.match
+
+    def register(self, state: _ProgressState) -> None:
+        """Route the current thread's log records to state."""
+        with self._states_lock:
+            self._states[threading.get_ident()] = state
+
+    def unregister(self) -> None:
+        """Stop routing the current thread's log records."""
+        with self._states_lock:
+            self._states.pop(threading.get_ident(), None)
 
     def emit(self, record: logging.LogRecord) -> None:
         try:
-            # Drop records until bind_thread() has run, and always drop records
-            # from threads other than the bound conversion thread.  This prevents
-            # concurrent conversions from cross-contaminating each other's counts.
-            if self._thread_id is None or record.thread != self._thread_id:
+            state = self._get_state(record.thread)
+            if state is None:
                 return
-            msg = self.format(record)
-            if _PAGE_LOG_RE.search(msg):
-                self._ticks = min(self._ticks + 1, self.total)
-                asyncio.run_coroutine_threadsafe(
-                    self.ctx.report_progress(self._ticks, self.total),
-                    self.loop,
-                )
+            # Cheap reject on the raw format string before building the message.
+            # pdf2docx logs "(%d/%d) Page %d", so a page tick always starts
+            # with "(" and the anchored match is enough.
+            msg = record.msg if isinstance(record.msg, str) else str(record.msg)
+            if not msg or msg[0] != "(":
+                return
+            if self._match(record.getMessage()):
+                state.ticks = min(state.ticks + 1, state.total)
         except Exception:
             self.handleError(record)
 
 
+# A single handler on the ROOT logger serves every request (pdf2docx calls
+# logging.info() directly), instead of attaching one handler per conversion.
+_progress_handler = _ProgressLogHandler(logging.DEBUG)
+logging.getLogger().addHandler(_progress_handler)
+
+
+class _PdfInfo(NamedTuple):
+    """Basic facts about a PDF, as read without a password."""
+
+    page_count: int
+    is_encrypted: bool
+    # Values of _META_KEYS, in order; a tuple keeps cache entries small and
+    # immutable.
+    metadata: tuple[str, ...]
+
+
+@functools.lru_cache(maxsize=128)
+def _pdf_stat_cache(path: str, mtime_ns: int, size: int) -> _PdfInfo:
+    """Open the PDF once per (path, mtime, size) and remember its basic facts.
+
+    mtime and size are only part of the cache key, so editing the file
+    invalidates the entry.
+    """
+    import fitz  # PyMuPDF
+
+    with fitz.open(path) as doc:
+        metadata = doc.metadata or {}
+        return _PdfInfo(
+            doc.page_count,
+            doc.needs_pass,
+            tuple(metadata.get(k, "") for k in _META_KEYS),
+        )
+
+
+@functools.lru_cache(maxsize=128)
+def _pdf_hash(path: str, mtime_ns: int, size: int) -> str:
+    """Return an xxh3_64 hex digest of the PDF's content.
+
+    Files up to 2 MiB are hashed whole. Larger files are sampled: the digest
+    covers the file size plus the first and last MiB, so two large files that
+    differ only in the middle get the same hash. Keyed like _pdf_stat_cache,
+    so an edited file is hashed again.
+    """
+    import xxhash
+
+    h = xxhash.xxh3_64()
+    h.update(size.to_bytes(8, "little"))
+    with open(path, "rb") as f:
+        if size <= 2 * _HASH_SAMPLE_BYTES:
+            h.update(f.read())
+        else:
+            h.update(f.read(_HASH_SAMPLE_BYTES))
+            f.seek(-_HASH_SAMPLE_BYTES, os.SEEK_END)
+            h.update(f.read())
+    return h.hexdigest()
+
+
+def _convert_file(
+    pdf_path: str,
+    output_path: str,
+    password: Optional[str],
+    pages: Optional[Sequence[int]] = None,
+) -> int:
+    """Convert pages (default: all) of pdf_path into output_path with one Converter.
+
+    Returns the size of the written file in bytes.
+    """
+    from pdf2docx import Converter
+
+    cv = Converter(pdf_path, password=password)
+    try:
+        if pages:
+            cv.convert(output_path, pages=pages)
+        else:
+            cv.convert(output_path)
+    finally:
+        cv.close()
+    return os.stat(output_path).st_size
+
+
+def _convert_chunk(
+    pdf_path: str, password: Optional[str], pages_chunk: Sequence[int], tmp_out: str
+) -> int:
+    """Convert a subset of pages into a standalone DOCX. Runs in a worker process."""
+    _convert_file(pdf_path, tmp_out, password, pages_chunk)
+    return len(pages_chunk)
+
+
+def _convert_batch_item(
+    pdf_path: str, output_path: str, password: Optional[str]
+) -> dict:
+    """Convert one PDF of a convert_batch call. Runs in a worker process."""
+    try:
+        if not os.path.exists(pdf_path):
+            return {
+                "success": False,
+                "input_path": pdf_path,
+                "message": f"PDF file not found: {pdf_path}",
+            }
+
+        start_time = time.monotonic()
+        output_size = _convert_file(pdf_path, output_path, password)
+        duration = round(time.monotonic() - start_time, 1)
+
+        return {
+            "success": True,
+            "input_path": pdf_path,
+            "output_path": output_path,
+            "size_mb": round(output_size / (1024 * 1024), 2),
+            "duration_seconds": duration,
+            "message": f"Successfully converted to {output_path} in {duration}s",
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "input_path": pdf_path,
+            "output_path": output_path,
+            "error": str(e),
+            "message": f"Error converting PDF: {str(e)}",
+        }
+
+
+def _warmup() -> None:
+    """Load the conversion libraries ahead of the first request.
+
+    Runs in a background thread at server startup and, in convert_batch
+    workers, after _init_worker has moved stdout to stderr. Errors are ignored here and surface from the real call.
+    """
+    try:
+        import fitz  # noqa: F401
+        import pdf2docx  # noqa: F401
+    except Exception:
+        pass
+
+
+def _init_worker(initializer: Optional[Callable[[], None]] = None) -> None:
+    """Process pool initializer: keep worker output off the JSON-RPC channel.
+
+    Workers inherit the server's stdout, which carries MCP messages in stdio
+    mode; PyMuPDF's warnings and pdf2docx's print() calls would corrupt it.
+    Both fd 1 and sys.stdout are pointed at stderr before anything is imported,
+    then the optional initializer runs.
+    """
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+    if initializer:
+        initializer()
+
+
+def _docx_path_for(pdf_path: str, output_dir: Optional[str] = None) -> str:
+    """Default DOCX path for pdf_path: same name, in output_dir or next to the PDF."""
+    if output_dir:
+        pdf_path = os.path.join(output_dir, os.path.basename(pdf_path))
+    root, _ = os.path.splitext(pdf_path)
+    return root + ".docx"
+
+
+def _merge_docx(parts: Sequence[str], output_path: str) -> int:
+    """Concatenate the per-chunk DOCX files, in order, into output_path.
+
+    pdf2docx ends every page with a section. Within a part that is a sectPr in
+    the page's last paragraph, but the part's final page is closed by the
+    body-level sectPr, which Composer.append() drops. Each part boundary is
+    therefore closed explicitly, the way python-docx's add_section() does, so
+    the merged document has the same sections as a single-Converter run.
+
+    Returns the size of the written file in bytes.
+    """
+    from docx import Document
+    from docxcompose.composer import Composer
+
+    master = Document(parts[0])
+    body = master.element.body
+    composer = Composer(master)
+    last_sect_pr = body.sectPr
+    for part in parts[1:]:
+        # An empty paragraph carrying the previous part's final section
+        # properties ends its last page.
+        body.add_p().get_or_add_pPr().append(copy.deepcopy(last_sect_pr))
+        doc = Document(part)
+        last_sect_pr = copy.deepcopy(doc.element.body.sectPr)
+        composer.append(doc)
+    # The document's closing section belongs to the last part's last page.
+    body.remove(body.sectPr)
+    body.append(last_sect_pr)
+    composer.save(output_path)
+    return os.stat(output_path).st_size
+
+
+def _parse_pages(pages: str) -> Optional[Sequence[int]]:
+    """Parse a page spec into 0-based page indexes, or None if it is malformed.
+
+    Indexes come back sorted and without duplicates, as pdf2docx converts
+    them, so splitting them across workers cannot reorder or repeat pages.
+    A single "A-B" range stays a lazy range object; pdf2docx accepts any
+    sequence of page indexes.
+    """
+    if not _PAGES_RE.match(pages):
+        return None
+    parts = pages.split(",")
+    pages_list: list[int] = []
+    for part in parts:
+        if "-" in part:
+            start, end = map(int, part.split("-", 1))
+            if start > end:
+                return None
+            if len(parts) == 1:
+                return range(start, end + 1)
+            pages_list.extend(range(start, end + 1))
+        else:
+            pages_list.append(int(part))
+    return tuple(sorted(set(pages_list)))
+
+
+def _pages_in_bounds(pages_list: Sequence[int], total_pages: Optional[int]) -> bool:
+    """Check that pages_list is non-empty and every index is within the PDF.
+
+    With total_pages=None only the lower bound is checked; pdf2docx rejects
+    indexes past the last page itself.
+    """
+    if not pages_list:
+        return False
+    if isinstance(pages_list, range):
+        # Ranges are always ascending here, so the ends bound every element.
+        first, last = pages_list[0], pages_list[-1]
+    else:
+        first, last = min(pages_list), max(pages_list)
+    return 0 <= first and (total_pages is None or last < total_pages)
+
+
+def _split_pages(pages_list: Sequence[int], max_workers: int) -> list[Sequence[int]]:
+    """Split pages into contiguous, ordered chunks, one per worker process."""
+    workers = min(max_workers, len(pages_list) // _MIN_PAGES_PER_WORKER)
+    if workers <= 1:
+        return [pages_list]
+    size = -(-len(pages_list) // workers)  # ceil division
+    return [pages_list[i : i + size] for i in range(0, len(pages_list), size)]
+
+
+async def _pump_progress(ctx: Context, state: _ProgressState) -> None:
+    """Report state.ticks to the client every _PROGRESS_INTERVAL until cancelled.
+
+    Only whole-percent increases are sent, so a job produces at most 100
+    notifications however many pages it has.
+    """
+    report = ctx.report_progress
+    total = max(state.total, 1)
+    last_pct = 0
+    while True:
+        await asyncio.sleep(_PROGRESS_INTERVAL)
+        ticks = state.ticks
+        pct = ticks * 100 // total
+        if pct > last_pct:
+            last_pct = pct
+            await report(ticks, state.total)
+
+
+@contextlib.asynccontextmanager
+async def _process_pool(
+    max_workers: int, initializer: Optional[Callable[[], None]] = None
+) -> AsyncIterator[ProcessPoolExecutor]:
+    """A spawn-based ProcessPoolExecutor whose shutdown never blocks the loop.
+
+    Workers write to stderr only (see _init_worker). On success the pool is shut down in a thread. On error or cancellation,
+    queued work is dropped and running workers are terminated, rather than
+    letting shutdown(wait=True) stall every other request until they finish.
+    """
+    pool = ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=_MP_CONTEXT,
+        initializer=_init_worker,
+        initargs=(initializer,),
+    )
+    try:
+        yield pool
+    except BaseException:
+        # Snapshot the workers first; shutdown() may clear the mapping.
+        workers = list((pool._processes or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for worker in workers:
+            worker.terminate()
+        raise
+    await asyncio.to_thread(pool.shutdown)
+
+
+async def _convert_parallel(
+    pdf_path: str,
+    password: Optional[str],
+    chunks: Sequence[Sequence[int]],
+    output_path: str,
+    state: Optional[_ProgressState],
+) -> int:
+    """Convert page chunks in separate processes, then merge them into one DOCX.
+
+    pdf2docx logs from the worker processes never reach this process, so
+    progress advances per finished chunk instead of per page. Returns the size
+    of the merged file in bytes.
+    """
+    loop = asyncio.get_running_loop()
+    # Terminated workers may still be writing parts when the directory is
+    # removed, so cleanup errors are ignored.
+    with tempfile.TemporaryDirectory(
+        prefix="pdf2docx-", ignore_cleanup_errors=True
+    ) as tmp_dir:
+        # Chunks are contiguous and ordered, so merging parts by index keeps
+        # the original page order regardless of which worker finishes first.
+        parts = [os.path.join(tmp_dir, f"part-{i}.docx") for i in range(len(chunks))]
+        async with _process_pool(len(chunks)) as pool:
+            futures = [
+                loop.run_in_executor(
+                    pool, _convert_chunk, pdf_path, password, chunk, part
+                )
+                for chunk, part in zip(chunks, parts)
+            ]
+            for future in asyncio.as_completed(futures):
+                pages_done = await future
+                if state:
+                    # Each page counts twice (parse + create), as in the handler.
+                    state.ticks = min(state.ticks + 2 * pages_done, state.total)
+
+        return await asyncio.to_thread(_merge_docx, parts, output_path)
+
+
 @mcp.tool()
 async def convert(
     pdf_path: str,
     output_path: Optional[str] = None,
     pages: Optional[str] = None,
     password: Optional[str] = None,
+    num_workers: Optional[int] = None,
     ctx: Optional[Context] = None,
 ) -> dict:
     """
@@ -89,8 +546,9 @@ async def convert(
     Args:
         pdf_path: Absolute path to the input PDF file
         output_path: Absolute path for the output DOCX file. If not provided, uses the same directory as pdf_path with .docx extension
-        pages: Optional page numbers to convert (0-indexed). Formats: "0,1,2" or "0-5"
+        pages: Optional page numbers to convert (0-indexed). Formats: "0,1,2", "0-5" or mixed "0,2-4,7"
         password: Optional password for encrypted PDFs
+        num_workers: Optional number of worker processes for large PDFs. Defaults to (and is capped at) the CPU count; 1 disables parallel conversion
 
     Returns:
         Dictionary containing:
@@ -99,45 +557,96 @@ async def convert(
         - output_path: Path to the output DOCX file
         - size_mb: Size of the output file in MB
         - pages: Pages that were converted
-        - total_pages: Total number of pages in the PDF
+        - total_pages: Total number of pages in the PDF (null when pages is given without a password and converted in one process)
         - pages_converted: Number of pages actually converted
         - duration_seconds: Time taken for conversion
     """
     try:
-        if not os.path.exists(pdf_path):
+        import fitz  # PyMuPDF
+
+        # One stat() serves the existence check and the metadata cache key.
+        try:
+            st = os.stat(pdf_path)
+        except FileNotFoundError:
             return {
                 "success": False,
                 "input_path": pdf_path,
                 "message": f"PDF file not found: {pdf_path}",
             }
 
-        if output_path is None:
-            base_name = os.path.splitext(pdf_path)[0]
-            output_path = f"{base_name}.docx"
-
-        output_dir = os.path.dirname(output_path)
-        if output_dir and not os.path.exists(output_dir):
-            os.makedirs(output_dir, exist_ok=True)
+        if num_workers is not None and num_workers < 1:
+            return {
+                "success": False,
+                "input_path": pdf_path,
+                "message": f"num_workers must be at least 1, got {num_workers}",
+            }
 
-        pages_list = None
+        # Reject malformed specs before any filesystem, PDF parsing or
+        # conversion work.
+        pages_list: Optional[Sequence[int]] = None
         if pages:
-            if "-" in pages:
-                start, end = pages.split("-")
-                pages_list = list(range(int(start), int(end) + 1))
+            pages_list = _parse_pages(pages)
+            if pages_list is None:
+                return {
+                    "success": False,
+                    "input_path": pdf_path,
+                    "message": f"Invalid pages spec: {pages!r}",
+                }
+
+        cpu_count = os.cpu_count() or 1
+        max_workers = min(num_workers or cpu_count, cpu_count, _MAX_CONCURRENCY)
+
+        total_pages: Optional[int]
+        if (
+            pages_list is not None
+            and not password
+            and len(_split_pages(pages_list, max_workers)) == 1
+        ):
+            # Explicit pages already give the progress total, so skip parsing
+            # the PDF up front just to count its pages; a single Converter
+            # rejects indexes past the last page itself. Specs large enough to
+            # fan out are bounds-checked below first, so a range such as
+            # "0-99" on a 20-page PDF never spawns workers.
+            total_pages = None
+        else:
+            # Get total page count before conversion for progress reporting.
+            # Authenticate if the PDF is encrypted so page_count is accurate;
+            # password-authenticated results are never cached.
+            info = _pdf_stat_cache(pdf_path, st.st_mtime_ns, st.st_size)
+            if password and info.is_encrypted:
+                with fitz.open(pdf_path) as doc:
+                    if not doc.authenticate(password):
+                        return {
+                            "success": False,
+                            "input_path": pdf_path,
+                            "message": "Invalid password for encrypted PDF",
+                        }
+                    total_pages = doc.page_count
             else:
-                pages_list = [int(p.strip()) for p in pages.split(",")]
-
-        # Get total page count before conversion for progress reporting.
-        # Authenticate if the PDF is encrypted so page_count is accurate.
-        with fitz.open(pdf_path) as doc:
-            if password and doc.needs_pass:
-                if not doc.authenticate(password):
-                    return {
-                        "success": False,
-                        "input_path": pdf_path,
-                        "message": "Invalid password for encrypted PDF",
-                    }
-            total_pages = doc.page_count
+                total_pages = info.page_count
+
+        if pages_list is not None and not _pages_in_bounds(pages_list, total_pages):
+            if total_pages is None:
+                message = f"Invalid pages {pages!r}: page indexes must be 0 or greater"
+            else:
+                message = (
+                    f"Invalid pages {pages!r}: PDF has {total_pages} page(s), "
+                    f"valid indexes are 0-{total_pages - 1}"
+                )
+            return {
+                "success": False,
+                "input_path": pdf_path,
+                "message": message,
+            }
+
+        # Only touch the filesystem once the request has passed validation.
+        if output_path is None:
+            # Same directory as the input, which the stat() above proved exists.
+            output_path = _docx_path_for(pdf_path)
+        else:
+            output_dir = os.path.dirname(output_path)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
 
         pages_to_convert = len(pages_list) if pages_list else total_pages
         # pdf2docx runs two phases (parse + create), each logging N messages.
@@ -148,50 +657,69 @@ async def convert(
         if ctx:
             await ctx.report_progress(0, progress_total)
 
-        # Attach a logging handler to the ROOT logger to intercept pdf2docx
-        # per-page log messages (pdf2docx calls logging.info() directly).
-        handler: Optional[_ProgressLogHandler] = None
-        if ctx:
-            loop = asyncio.get_running_loop()
-            handler = _ProgressLogHandler(ctx, pages_to_convert, loop)
-            handler.setLevel(logging.DEBUG)
-            logging.getLogger().addHandler(handler)
-
-        start_time = time.monotonic()
-        try:
-            # Run blocking conversion in a thread to avoid stalling the event loop.
-            def _run_conversion() -> None:
-                # Bind this thread so the handler ignores other concurrent jobs.
-                if handler:
-                    handler.bind_thread()
-                cv = Converter(pdf_path, password=password)
-                try:
-                    if pages_list:
-                        cv.convert(output_path, pages=pages_list)
-                    else:
-                        cv.convert(output_path)
-                finally:
-                    cv.close()
-
-            await asyncio.to_thread(_run_conversion)
-        finally:
-            if handler:
-                logging.getLogger().removeHandler(handler)
+        # Large jobs are split across worker processes; pdf2docx itself parses
+        # a document serially, so a single Converter leaves most cores idle.
+        # pdf2docx's own multi_processing option is not used: it ignores
+        # `pages` and writes fixed-name intermediate files into the current
+        # directory, which concurrent requests would overwrite.
+        chunks = _split_pages(
+            pages_list if pages_list else range(total_pages), max_workers
+        )
+
+        # Run blocking conversion in a thread to avoid stalling the event loop.
+        # The output size is read there too, right after the file is written.
+        def _run_conversion() -> int:
+            if not state:
+                return _convert_file(pdf_path, output_path, password, pages_list)
+            # Register this thread so the handler ignores other concurrent jobs.
+            _progress_handler.register(state)
+            try:
+                return _convert_file(pdf_path, output_path, password, pages_list)
+            finally:
+                _progress_handler.unregister()
+
+        # Bound the number of simultaneous Converters; each one can hold
+        # hundreds of MB. Parallel jobs take one slot per worker process.
+        async with _CONVERT_SLOTS.acquire(len(chunks)):
+            # Track this request's progress and start the task that forwards
+            # it to the client.
+            state: Optional[_ProgressState] = None
+            reporter: Optional[asyncio.Task] = None
+            if ctx:
+                state = _ProgressState(pages_to_convert)
+                reporter = asyncio.create_task(_pump_progress(ctx, state))
+
+            start_time = time.monotonic()
+            try:
+                if len(chunks) > 1:
+                    output_size = await _convert_parallel(
+                        pdf_path, password, chunks, output_path, state
+                    )
+                else:
+                    output_size = await asyncio.to_thread(_run_conversion)
+            finally:
+                if reporter:
+                    reporter.cancel()
+                    # Progress is best effort: a failed notification (e.g. the
+                    # client went away) must not fail a finished conversion.
+                    with contextlib.suppress(asyncio.CancelledError, Exception):
+                        await reporter
 
         duration = round(time.monotonic() - start_time, 1)
 
-        # Report completion (100%) using the same total as the handler
+        # Report completion (100%) using the same total as the reporter task
         if ctx:
-            await ctx.report_progress(progress_total, progress_total)
+            with contextlib.suppress(Exception):
+                await ctx.report_progress(progress_total, progress_total)
 
-        file_size_mb = os.path.getsize(output_path) / (1024 * 1024)
+        file_size_mb = output_size / (1024 * 1024)
 
         return {
             "success": True,
             "input_path": pdf_path,
             "output_path": output_path,
             "size_mb": round(file_size_mb, 2),
-            "pages": pages_list if pages_list else "all",
+            "pages": list(pages_list) if pages_list else "all",
             "total_pages": total_pages,
             "pages_converted": pages_to_convert,
             "duration_seconds": duration,
@@ -211,6 +739,132 @@ async def convert(
         }
 
 
+@mcp.tool()
+async def convert_batch(
+    pdf_paths: list[str],
+    output_dir: Optional[str] = None,
+    password: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    ctx: Optional[Context] = None,
+) -> dict:
+    """
+    Convert several PDF files to DOCX format in parallel worker processes
+
+    Args:
+        pdf_paths: Absolute paths to the input PDF files
+        output_dir: Directory for the output DOCX files. If not provided, each DOCX is written next to its PDF
+        password: Optional password applied to every encrypted PDF
+        max_workers: Optional number of worker processes. Defaults to (and is capped at) the CPU count
+
+    Returns:
+        Dictionary containing:
+        - success: Boolean indicating if every file was converted
+        - results: Per-file results in input order (success, input_path, output_path, size_mb, duration_seconds, message)
+        - files_converted: Number of files converted successfully
+        - files_failed: Number of files that failed
+        - duration_seconds: Time taken for the whole batch
+    """
+    try:
+        if not pdf_paths:
+            return {"success": False, "message": "No PDF files given"}
+        if max_workers is not None and max_workers < 1:
+            return {
+                "success": False,
+                "message": f"max_workers must be at least 1, got {max_workers}",
+            }
+
+        # Inputs sharing a file name (or listed twice) would be converted into
+        # the same DOCX concurrently; reject them instead of losing outputs.
+        output_paths = [_docx_path_for(p, output_dir) for p in pdf_paths]
+        seen: dict[str, str] = {}
+        for pdf_path, output_path in zip(pdf_paths, output_paths):
+            key = os.path.normcase(os.path.abspath(output_path))
+            if key in seen:
+                return {
+                    "success": False,
+                    "message": (
+                        f"{seen[key]} and {pdf_path} would both be converted to "
+                        f"{output_path}"
+                    ),
+                }
+            seen[key] = pdf_path
+
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+        total_files = len(pdf_paths)
+        if ctx:
+            await ctx.report_progress(0, total_files)
+
+        cpu_count = os.cpu_count() or 1
+        workers = min(
+            max_workers or cpu_count, cpu_count, total_files, _MAX_CONCURRENCY
+        )
+        loop = asyncio.get_running_loop()
+        start_time = time.monotonic()
+        # The batch holds one slot of the global limit per worker process.
+        async with _CONVERT_SLOTS.acquire(workers):
+            # Worker processes are reused across files, so pdf2docx is loaded
+            # once per worker instead of once per conversion. The preload runs
+            # after the worker's stdout is redirected, so the import-time
+            # warnings stay off the JSON-RPC channel.
+            async with _process_pool(workers, initializer=_warmup) as pool:
+                files_done = 0
+
+                async def _run_item(pdf_path: str, output_path: str) -> dict:
+                    nonlocal files_done
+                    try:
+                        result = await loop.run_in_executor(
+                            pool, _convert_batch_item, pdf_path, output_path, password
+                        )
+                    except Exception as e:
+                        # A worker that dies (OOM kill, crash in PyMuPDF) breaks
+                        # the pool; record that per file instead of losing the
+                        # results of the whole batch.
+                        error = str(e) or type(e).__name__
+                        result = {
+                            "success": False,
+                            "input_path": pdf_path,
+                            "output_path": output_path,
+                            "error": error,
+                            "message": f"Error converting PDF: {error}",
+                        }
+                    files_done += 1
+                    if ctx:
+                        with contextlib.suppress(Exception):
+                            await ctx.report_progress(files_done, total_files)
+                    return result
+
+                results = await asyncio.gather(
+                    *(
+                        _run_item(pdf_path, output_path)
+                        for pdf_path, output_path in zip(pdf_paths, output_paths)
+                    )
+                )
+
+        duration = round(time.monotonic() - start_time, 1)
+        files_converted = sum(1 for r in results if r["success"])
+        files_failed = total_files - files_converted
+
+        return {
+            "success": files_failed == 0,
+            "results": results,
+            "files_converted": files_converted,
+            "files_failed": files_failed,
+            "duration_seconds": duration,
+            "message": (
+                f"Converted {files_converted} of {total_files} file(s) in {duration}s"
+            ),
+        }
+
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e),
+            "message": f"Error converting PDFs: {str(e)}",
+        }
+
+
 @mcp.tool()
 def get_info(pdf_path: str) -> dict:
     """
@@ -227,21 +881,24 @@ def get_info(pdf_path: str) -> dict:
         - size_mb: Size of the PDF file in MB
         - is_encrypted: Whether the PDF is encrypted
         - metadata: PDF metadata (title, author, subject, creator, producer)
+        - content_hash: Hash of the file content (sampled for files over 2 MiB), usable as a client-side cache key
     """
     try:
-        if not os.path.exists(pdf_path):
+        # One stat() serves the existence check, the size and the cache key.
+        try:
+            st = os.stat(pdf_path)
+        except FileNotFoundError:
             return {
                 "success": False,
                 "path": pdf_path,
                 "message": f"PDF file not found: {pdf_path}",
             }
 
-        file_size_mb = os.path.getsize(pdf_path) / (1024 * 1024)
+        file_size_mb = st.st_size / (1024 * 1024)
 
-        with fitz.open(pdf_path) as doc:
-            page_count = doc.page_count
-            is_encrypted = doc.needs_pass
-            metadata = doc.metadata
+        page_count, is_encrypted, metadata = _pdf_stat_cache(
+            pdf_path, st.st_mtime_ns, st.st_size
+        )
 
         return {
             "success": True,
@@ -249,13 +906,8 @@ def get_info(pdf_path: str) -> dict:
             "page_count": page_count,
             "size_mb": round(file_size_mb, 2),
             "is_encrypted": is_encrypted,
-            "metadata": {
-                "title": metadata.get("title", ""),
-                "author": metadata.get("author", ""),
-                "subject": metadata.get("subject", ""),
-                "creator": metadata.get("creator", ""),
-                "producer": metadata.get("producer", ""),
-            },
+            "content_hash": _pdf_hash(pdf_path, st.st_mtime_ns, st.st_size),
+            "metadata": dict(zip(_META_KEYS, metadata)),
             "message": f"Found PDF with {page_count} page(s)",
         }
 
@@ -269,5 +921,7 @@ def get_info(pdf_path: str) -> dict:
 
 
 if __name__ == "__main__":
+    # 后台预加载 pdf2docx，与 MCP 握手并行
+    threading.Thread(target=_warmup, name="pdf2docx-warmup", daemon=True).start()
     # 以 stdio 方式运行服务器
     mcp.run()
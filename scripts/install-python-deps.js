@@ -18,6 +18,20 @@ const PYTHON_REQUIREMENTS = path.join(
 
 const VENV_DIR = path.join(os.homedir(), ".pdf2docx-mcp", "venv");
 
+// 已安装依赖时所用 requirements.txt 的副本，内容变化（如升级后新增依赖）时重新安装
+const REQUIREMENTS_STAMP = path.join(VENV_DIR, ".requirements.txt");
+
+function requirementsChanged() {
+  try {
+    return (
+      fs.readFileSync(REQUIREMENTS_STAMP, "utf8") !==
+      fs.readFileSync(PYTHON_REQUIREMENTS, "utf8")
+    );
+  } catch {
+    return true;
+  }
+}
+
 function getVenvPython() {
   if (process.platform === "win32") {
     return path.join(VENV_DIR, "Scripts", "python.exe");
@@ -119,7 +133,10 @@ async function main() {
   }
 
   try {
-    // 检查是否已安装（用 venv 的 python）
+    // 检查依赖是否有变化，以及是否已安装（用 venv 的 python）
+    if (requirementsChanged()) {
+      throw new Error("requirements.txt changed");
+    }
     await spawnAsync(venvPython, ["-c", "import mcp"]);
     console.log("✅ Python dependencies already installed");
   } catch {
@@ -133,6 +150,7 @@ async function main() {
           stdio: "inherit",
         },
       );
+      fs.copyFileSync(PYTHON_REQUIREMENTS, REQUIREMENTS_STAMP);
       console.log("✅ Python dependencies installed successfully");
     } catch {
       console.warn("Failed to install Python dependencies during postinstall");